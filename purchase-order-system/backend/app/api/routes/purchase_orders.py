@@ -1,10 +1,14 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.core.page_cache import get_page_cache
 from app.schemas import (
+    MAX_ORDER_ID,
+    PurchaseOrderBatchRequest,
+    PurchaseOrderBatchResponse,
     PurchaseOrderCreate,
     PurchaseOrderCursorPage,
     PurchaseOrderResponse,
@@ -25,13 +29,61 @@ def list_purchase_orders(
 def list_purchase_orders_with_cursor(
     cursor: Optional[str] = Query(None, description="Opaque cursor for pagination"),
     limit: int = Query(50, ge=1, le=200, description="Number of records to return"),
+    snapshot: bool = Query(
+        False,
+        description="Pin a snapshot on the first page; later cursors keep it",
+    ),
     db: Session = Depends(get_db),
 ) -> PurchaseOrderCursorPage:
-    return PurchaseOrderService.list_orders_with_cursor(
+    page_cache = get_page_cache()
+    if page_cache is None or PurchaseOrderService.is_snapshot_request(
+        cursor=cursor,
+        snapshot=snapshot,
+    ):
+        return PurchaseOrderService.list_orders_with_cursor(
+            db,
+            cursor=cursor,
+            limit=limit,
+            snapshot=snapshot,
+        )
+
+    payload = PurchaseOrderService.render_cursor_page(
         db,
+        page_cache,
         cursor=cursor,
         limit=limit,
     )
+    return Response(content=payload, media_type="application/json")
+
+
+@router.get("/batch", response_model=PurchaseOrderBatchResponse)
+def get_purchase_orders_batch(
+    ids: List[str] = Query(
+        default=[],
+        description="Order ids, comma-separated and/or repeated",
+    ),
+    db: Session = Depends(get_db),
+) -> PurchaseOrderBatchResponse:
+    try:
+        order_ids = [
+            int(value)
+            for raw in ids
+            for value in raw.split(",")
+            if value.strip()
+        ]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid ids")
+    if any(not 0 <= order_id <= MAX_ORDER_ID for order_id in order_ids):
+        raise HTTPException(status_code=400, detail="Invalid ids")
+    return PurchaseOrderService.get_orders_batch(db, order_ids)
+
+
+@router.post("/batch", response_model=PurchaseOrderBatchResponse)
+def get_purchase_orders_batch_post(
+    request: PurchaseOrderBatchRequest,
+    db: Session = Depends(get_db),
+) -> PurchaseOrderBatchResponse:
+    return PurchaseOrderService.get_orders_batch(db, request.ids)
 
 
 @router.get("/{order_id}", response_model=PurchaseOrderResponse)
@@ -13,6 +13,57 @@ class Settings:
         self.cors_allow_headers = ["*"]
         self.project_name = "Purchase Order API"
 
+        self.soft_delete_enabled: bool = (
+            os.getenv("SOFT_DELETE_ENABLED", "false").lower() == "true"
+        )
+        self.compaction_enabled: bool = (
+            os.getenv("COMPACTION_ENABLED", "false").lower() == "true"
+        )
+        self.compaction_interval_seconds: int = int(
+            os.getenv("COMPACTION_INTERVAL_SECONDS", "3600")
+        )
+        self.compaction_batch_size: int = int(
+            os.getenv("COMPACTION_BATCH_SIZE", "1000")
+        )
+        self.compaction_batch_pause_seconds: float = float(
+            os.getenv("COMPACTION_BATCH_PAUSE_SECONDS", "0.5")
+        )
+        self.compaction_grace_seconds: int = int(
+            os.getenv("COMPACTION_GRACE_SECONDS", "86400")
+        )
+        self.compaction_window_start_hour: int = int(
+            os.getenv("COMPACTION_WINDOW_START_HOUR", "1")
+        )
+        self.compaction_window_end_hour: int = int(
+            os.getenv("COMPACTION_WINDOW_END_HOUR", "5")
+        )
 
-settings = Settings()
+        self.page_cache_enabled: bool = (
+            os.getenv("PAGE_CACHE_ENABLED", "false").lower() == "true"
+        )
+        self.page_cache_path: str = os.getenv(
+            "PAGE_CACHE_PATH",
+            "/dev/shm/purchase_orders_page_cache",
+        )
+        self.page_cache_slots: int = int(os.getenv("PAGE_CACHE_SLOTS", "64"))
+        self.page_cache_slot_bytes: int = int(
+            os.getenv("PAGE_CACHE_SLOT_BYTES", "65536")
+        )
+        self.page_cache_max_age_seconds: float = float(
+            os.getenv("PAGE_CACHE_MAX_AGE_SECONDS", "60")
+        )
+
+        self.batch_max_ids: int = int(os.getenv("BATCH_MAX_IDS", "500"))
 
+        # Snapshot cursors older than this are rejected; compaction keeps
+        # tombstones at least this long so snapshots stay consistent.
+        self.snapshot_max_age_seconds: int = int(
+            os.getenv("SNAPSHOT_MAX_AGE_SECONDS", "3600")
+        )
+        # Signs snapshot cursors so clients cannot rewrite the pinned
+        # high-water mark. Must be the same on every worker and replica;
+        # snapshot pagination is rejected while it is unset.
+        self.cursor_secret: str = os.getenv("CURSOR_SECRET", "")
+
+
+settings = Settings()
@@ -0,0 +1,34 @@
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Union
+
+CENTS_PER_UNIT = 100
+# unit_price_cents is a 32-bit INTEGER column.
+MAX_UNIT_PRICE_CENTS = 2**31 - 1
+
+_CENT = Decimal("0.01")
+
+
+def to_cents(amount: Union[float, int, str, Decimal]) -> int:
+    """
+    Convert a currency amount to integer minor units, rounding half up.
+
+    Raises ValueError for non-finite amounts and amounts too large to quantize.
+    """
+    try:
+        value = Decimal(str(amount))
+        if not value.is_finite():
+            raise ValueError("amount must be finite")
+        value = value.quantize(_CENT, rounding=ROUND_HALF_UP)
+    except InvalidOperation as exc:
+        raise ValueError("amount is out of range") from exc
+    return int(value * CENTS_PER_UNIT)
+
+
+def from_cents(cents: int) -> float:
+    """Convert integer minor units back to a currency amount for the API."""
+    return cents / CENTS_PER_UNIT
+
+
+def cents_to_decimal(cents: Union[int, Decimal]) -> Decimal:
+    """Convert minor units (or an exact aggregate of them) to a Decimal amount."""
+    return Decimal(cents) / CENTS_PER_UNIT
@@ -0,0 +1,259 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from app.core.config import settings
+
+# File layout: a header holding the global generation counter, the format
+# version and the slot geometry, followed by fixed-size slots. Each slot
+# starts with a sequence number (odd while a writer is mid-update), the
+# generation it was filled at, the key hash, the write time and the payload
+# length, followed by the pre-serialized page bytes.
+FORMAT_VERSION = 2
+_GENERATION = struct.Struct("<Q")
+_LAYOUT = struct.Struct("<III")
+_LAYOUT_OFFSET = 8
+_HEADER_SIZE = 64
+_SLOT_HEADER = struct.Struct("<QQQQI")
+_SLOT_HEADER_SIZE = 64
+_SEQ = struct.Struct("<Q")
+_FILL_POLL_SECONDS = 0.001
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _hash_key(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(),
+        "little",
+    )
+
+
+class SharedPageCache:
+    """
+    Host-wide cache of serialized cursor pages, shared by all worker processes.
+
+    The cache lives in a memory-mapped file (by default under /dev/shm), so
+    every uvicorn worker on the host reads and writes the same pages. Writes
+    are serialized with an exclusive ``flock`` plus an in-process thread lock;
+    reads are lock-free and use the per-slot sequence number to detect torn
+    reads. Bumping the generation
+    counter invalidates every cached page at once, and pages older than
+    ``max_age_seconds`` are never served, which bounds staleness after writes
+    that do not bump the generation (manual SQL, other hosts).
+
+    Misses are filled single-flight: one worker renders a page while the
+    others poll for it, holding a byte-range lock on the slot, so an
+    invalidation does not send every worker to the database at once.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        slot_count: int,
+        slot_size: int,
+        max_age_seconds: float = 60,
+        fill_wait_seconds: float = 0.05,
+    ) -> None:
+        self.path = path
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self.max_payload_size = slot_size - _SLOT_HEADER_SIZE
+        self.max_age_ms = int(max_age_seconds * 1000)
+        self.fill_wait_seconds = fill_wait_seconds
+        # fcntl record locks are per process, so threads in one worker also
+        # need an in-process lock per slot.
+        self._slot_locks = [threading.Lock() for _ in range(slot_count)]
+        # flock does not exclude threads sharing this fd, so writers in one
+        # worker are serialized in-process first.
+        self._write_lock = threading.Lock()
+        size = _HEADER_SIZE + slot_count * slot_size
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked():
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+            self._mm = mmap.mmap(self._fd, size)
+            layout = (FORMAT_VERSION, slot_count, slot_size)
+            if _LAYOUT.unpack_from(self._mm, _LAYOUT_OFFSET) != layout:
+                # Written by another format or geometry: start from empty slots.
+                self._mm[_HEADER_SIZE:size] = bytes(size - _HEADER_SIZE)
+                _GENERATION.pack_into(self._mm, 0, self.generation() + 1)
+                _LAYOUT.pack_into(self._mm, _LAYOUT_OFFSET, *layout)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._write_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _slot_offset(self, key_hash: int) -> int:
+        return _HEADER_SIZE + (key_hash % self.slot_count) * self.slot_size
+
+    def _try_lock_slot(self, key_hash: int) -> bool:
+        lock = self._slot_locks[key_hash % self.slot_count]
+        if not lock.acquire(blocking=False):
+            return False
+        try:
+            fcntl.lockf(
+                self._fd,
+                fcntl.LOCK_EX | fcntl.LOCK_NB,
+                self.slot_size,
+                self._slot_offset(key_hash),
+            )
+        except OSError:
+            lock.release()
+            return False
+        return True
+
+    def _unlock_slot(self, key_hash: int) -> None:
+        fcntl.lockf(
+            self._fd,
+            fcntl.LOCK_UN,
+            self.slot_size,
+            self._slot_offset(key_hash),
+        )
+        self._slot_locks[key_hash % self.slot_count].release()
+
+    def generation(self) -> int:
+        return _GENERATION.unpack_from(self._mm, 0)[0]
+
+    def bump_generation(self) -> int:
+        with self._locked():
+            generation = self.generation() + 1
+            _GENERATION.pack_into(self._mm, 0, generation)
+        return generation
+
+    def get(self, key: str) -> Optional[bytes]:
+        key_hash = _hash_key(key)
+        offset = self._slot_offset(key_hash)
+
+        seq, generation, slot_hash, written_at, length = _SLOT_HEADER.unpack_from(
+            self._mm,
+            offset,
+        )
+        if seq % 2 or length == 0 or slot_hash != key_hash:
+            return None
+        if generation != self.generation():
+            return None
+        if _now_ms() - written_at > self.max_age_ms:
+            return None
+
+        start = offset + _SLOT_HEADER_SIZE
+        payload = self._mm[start:start + length]
+        if _SEQ.unpack_from(self._mm, offset)[0] != seq:
+            return None
+        return payload
+
+    def put(self, key: str, payload: bytes, generation: int) -> bool:
+        """
+        Store ``payload`` for ``key`` if ``generation`` is still current.
+
+        ``generation`` must be read before the page is built, so a page
+        rendered from data that changed mid-request is never cached.
+        """
+        if len(payload) > self.max_payload_size:
+            return False
+
+        key_hash = _hash_key(key)
+        offset = self._slot_offset(key_hash)
+        with self._locked():
+            if generation != self.generation():
+                return False
+
+            begin = self._begin_write(offset)
+            start = offset + _SLOT_HEADER_SIZE
+            self._mm[start:start + len(payload)] = payload
+            _SLOT_HEADER.pack_into(
+                self._mm,
+                offset,
+                begin,
+                generation,
+                key_hash,
+                _now_ms(),
+                len(payload),
+            )
+            self._finish_write(offset, begin)
+        return True
+
+    def _begin_write(self, offset: int) -> int:
+        # A writer that died mid-update leaves the sequence odd; forcing the
+        # in-progress value odd keeps readers away even in that case.
+        begin = _SEQ.unpack_from(self._mm, offset)[0] | 1
+        _SEQ.pack_into(self._mm, offset, begin)
+        return begin
+
+    def _finish_write(self, offset: int, begin: int) -> None:
+        _SEQ.pack_into(self._mm, offset, begin + 1)
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        payload = self.get(key)
+        if payload is not None:
+            return payload
+
+        key_hash = _hash_key(key)
+        deadline = time.monotonic() + self.fill_wait_seconds
+        while not self._try_lock_slot(key_hash):
+            time.sleep(_FILL_POLL_SECONDS)
+            payload = self.get(key)
+            if payload is not None:
+                return payload
+            if time.monotonic() >= deadline:
+                return self._render_and_put(key, render)
+
+        try:
+            payload = self.get(key)
+            if payload is not None:
+                return payload
+            return self._render_and_put(key, render)
+        finally:
+            self._unlock_slot(key_hash)
+
+    def _render_and_put(self, key: str, render: Callable[[], bytes]) -> bytes:
+        generation = self.generation()
+        payload = render()
+        self.put(key, payload, generation)
+        return payload
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+
+_page_cache: Optional[SharedPageCache] = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> Optional[SharedPageCache]:
+    """Return this process's handle on the shared page cache, if enabled."""
+    global _page_cache
+    if not settings.page_cache_enabled:
+        return None
+    if _page_cache is None:
+        with _page_cache_lock:
+            if _page_cache is None:
+                _page_cache = SharedPageCache(
+                    settings.page_cache_path,
+                    slot_count=settings.page_cache_slots,
+                    slot_size=settings.page_cache_slot_bytes,
+                    max_age_seconds=settings.page_cache_max_age_seconds,
+                )
+    return _page_cache
+
+
+def invalidate_pages() -> None:
+    page_cache = get_page_cache()
+    if page_cache is not None:
+        page_cache.bump_generation()
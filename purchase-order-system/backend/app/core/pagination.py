@@ -1,23 +1,96 @@
 import base64
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional, Tuple
+
 from fastapi import HTTPException
 
+from app.core.config import settings
+
+
+class CursorSnapshot(NamedTuple):
+    """High-water mark pinned by the first page of a snapshot pagination session."""
+
+    max_id: int
+    as_of: datetime
+    # Deletes stamped above this ChangeSequence value happened after the pin.
+    change_seq: int
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(micros: int) -> datetime:
+    return datetime.fromtimestamp(micros / 1_000_000, tz=timezone.utc)
+
+
+def require_cursor_secret() -> bytes:
+    if not settings.cursor_secret:
+        raise HTTPException(
+            status_code=400,
+            detail="Snapshot pagination requires CURSOR_SECRET to be set",
+        )
+    return settings.cursor_secret.encode("utf-8")
+
+
+def _sign(payload: str) -> str:
+    secret = require_cursor_secret()
+    return hmac.new(secret, payload.encode("utf-8"), hashlib.sha256).hexdigest()[:32]
+
 
-def encode_cursor(order_id: int) -> str:
-    raw = str(order_id).encode("utf-8")
-    encoded = base64.urlsafe_b64encode(raw).decode("utf-8")
+def encode_cursor(order_id: int, snapshot: Optional[CursorSnapshot] = None) -> str:
+    payload = str(order_id)
+    if snapshot is not None:
+        payload = ".".join(
+            str(part)
+            for part in (
+                order_id,
+                snapshot.max_id,
+                _to_micros(snapshot.as_of),
+                snapshot.change_seq,
+            )
+        )
+        payload = f"{payload}.{_sign(payload)}"
+    encoded = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8")
     return encoded.rstrip("=")
 
 
-def decode_cursor(cursor: str) -> int:
+def decode_cursor(cursor: str) -> Tuple[int, Optional[CursorSnapshot]]:
     padding = "=" * (-len(cursor) % 4)
     try:
         decoded = base64.urlsafe_b64decode(f"{cursor}{padding}").decode("utf-8")
-        order_id = int(decoded)
+        fields = decoded.split(".")
+        if len(fields) == 5:
+            # Snapshot cursors are signed so the pinned high-water mark
+            # cannot be moved to expose other soft-deleted rows.
+            payload, signature = decoded.rsplit(".", 1)
+            if not hmac.compare_digest(signature, _sign(payload)):
+                raise ValueError("bad signature")
+            fields = fields[:4]
+        elif len(fields) != 1:
+            raise ValueError("unsigned snapshot cursor")
+        parts = [int(part) for part in fields]
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    if order_id < 0:
+    if any(part < 0 for part in parts):
         raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return order_id
+    order_id = parts[0]
+    snapshot = None
+    if len(parts) == 4:
+        try:
+            snapshot = CursorSnapshot(
+                max_id=parts[1],
+                as_of=_from_micros(parts[2]),
+                change_seq=parts[3],
+            )
+        except (OverflowError, OSError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
+    return order_id, snapshot
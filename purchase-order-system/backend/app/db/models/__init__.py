@@ -1,2 +1,2 @@
+from .change_sequence import ChangeSequence  # noqa: F401
 from .purchase_order import PurchaseOrder  # noqa: F401
-
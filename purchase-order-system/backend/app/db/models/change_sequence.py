@@ -0,0 +1,26 @@
+from sqlalchemy import DDL, BigInteger, Column, Integer, event
+
+from app.db.base import Base
+
+
+class ChangeSequence(Base):
+    """
+    Single-row counter stamped on soft deletes.
+
+    Incrementing it takes a row lock that is held until the deleting
+    transaction commits, so deletes are numbered in commit order and a
+    snapshot that reads the counter sees exactly the deletes numbered at or
+    below it.
+    """
+
+    __tablename__ = "change_sequence"
+
+    id = Column(Integer, primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+
+
+event.listen(
+    ChangeSequence.__table__,
+    "after_create",
+    DDL("INSERT INTO change_sequence (id, value) VALUES (1, 0)"),
+)
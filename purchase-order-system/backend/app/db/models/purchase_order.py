@@ -1,4 +1,13 @@
-from sqlalchemy import Column, Date, Float, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Computed,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    String,
+)
 
 from app.db.base import Base
 
@@ -11,6 +20,26 @@ class PurchaseOrder(Base):
     order_date = Column(Date, nullable=False)
     delivery_date = Column(Date, nullable=False)
     quantity = Column(Integer, nullable=False)
-    unit_price = Column(Float, nullable=False)
-    total_price = Column(Float, nullable=False)
+    # Prices are stored as exact integer minor units (cents).
+    unit_price_cents = Column(Integer, nullable=False)
+    total_price_cents = Column(
+        BigInteger,
+        Computed("CAST(quantity AS BIGINT) * unit_price_cents", persisted=True),
+        nullable=False,
+    )
+    # Tombstone set by soft deletes; rows are hard-deleted later by compaction.
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # ChangeSequence value stamped with the tombstone; snapshots compare
+    # against it instead of timestamps.
+    deleted_seq = Column(BigInteger, nullable=True)
 
+    __table_args__ = (
+        # Partial index over live rows only, used by the list and cursor
+        # queries so tombstones never enter their index scans.
+        Index(
+            "ix_purchase_orders_live_id",
+            id,
+            postgresql_where=deleted_at.is_(None),
+            sqlite_where=deleted_at.is_(None),
+        ),
+    )
@@ -1,8 +1,11 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import Session
 
-from app.db.models import PurchaseOrder
+from app.core.pagination import CursorSnapshot
+from app.db.models import ChangeSequence, PurchaseOrder
 from app.schemas import PurchaseOrderCreate
 
 
@@ -11,6 +14,7 @@ class PurchaseOrderRepository:
     def list_all(db: Session) -> List[PurchaseOrder]:
         return (
             db.query(PurchaseOrder)
+            .filter(PurchaseOrder.deleted_at.is_(None))
             .order_by(PurchaseOrder.id.asc())
             .all()
         )
@@ -21,32 +25,91 @@ class PurchaseOrderRepository:
         *,
         last_id: Optional[int],
         limit: int,
+        snapshot: Optional[CursorSnapshot] = None,
     ) -> List[PurchaseOrder]:
         query = db.query(PurchaseOrder).order_by(PurchaseOrder.id.asc())
 
+        if snapshot is None:
+            query = query.filter(PurchaseOrder.deleted_at.is_(None))
+        else:
+            # Rows created after the snapshot are excluded by id; rows
+            # soft-deleted after it (stamped with a later change sequence)
+            # stay visible until the session ends.
+            query = query.filter(
+                PurchaseOrder.id <= snapshot.max_id,
+                or_(
+                    PurchaseOrder.deleted_at.is_(None),
+                    PurchaseOrder.deleted_seq > snapshot.change_seq,
+                ),
+            )
+
         if last_id is not None:
             query = query.filter(PurchaseOrder.id > last_id)
 
         return query.limit(limit + 1).all()
 
+    @staticmethod
+    def get_database_time(db: Session) -> datetime:
+        now = db.query(func.now()).scalar()
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        return now
+
+    @staticmethod
+    def get_snapshot(db: Session) -> CursorSnapshot:
+        max_id_query = select(func.max(PurchaseOrder.id)).scalar_subquery()
+        change_seq, max_id, as_of = (
+            db.query(ChangeSequence.value, max_id_query, func.now())
+            .filter(ChangeSequence.id == 1)
+            .one()
+        )
+        if as_of.tzinfo is None:
+            as_of = as_of.replace(tzinfo=timezone.utc)
+        return CursorSnapshot(
+            max_id=max_id or 0,
+            as_of=as_of,
+            change_seq=change_seq,
+        )
+
+    @staticmethod
+    def _next_change_seq(db: Session) -> int:
+        # The row lock taken here is held until the caller commits, so
+        # deletes commit in the order of the values they are stamped with.
+        return db.execute(
+            update(ChangeSequence)
+            .where(ChangeSequence.id == 1)
+            .values(value=ChangeSequence.value + 1)
+            .returning(ChangeSequence.value)
+        ).scalar_one()
+
     @staticmethod
     def get_order(db: Session, order_id: int) -> Optional[PurchaseOrder]:
         return (
             db.query(PurchaseOrder)
-            .filter(PurchaseOrder.id == order_id)
+            .filter(
+                PurchaseOrder.id == order_id,
+                PurchaseOrder.deleted_at.is_(None),
+            )
             .first()
         )
 
+    @staticmethod
+    def get_orders(db: Session, order_ids: List[int]) -> List[PurchaseOrder]:
+        return (
+            db.query(PurchaseOrder)
+            .filter(
+                PurchaseOrder.id.in_(order_ids),
+                PurchaseOrder.deleted_at.is_(None),
+            )
+            .all()
+        )
+
     @staticmethod
     def create_order(
         db: Session,
         order: PurchaseOrderCreate,
     ) -> PurchaseOrder:
-        total_price = order.quantity * order.unit_price
-        db_order = PurchaseOrder(
-            **order.model_dump(),
-            total_price=total_price,
-        )
+        db_order = PurchaseOrder(**order.to_db_values())
         db.add(db_order)
         db.commit()
         db.refresh(db_order)
@@ -57,3 +120,70 @@ class PurchaseOrderRepository:
         db.delete(order)
         db.commit()
 
+    @staticmethod
+    def soft_delete_order(db: Session, order_id: int) -> bool:
+        change_seq = PurchaseOrderRepository._next_change_seq(db)
+        updated = (
+            db.query(PurchaseOrder)
+            .filter(
+                PurchaseOrder.id == order_id,
+                PurchaseOrder.deleted_at.is_(None),
+            )
+            .update(
+                {
+                    PurchaseOrder.deleted_at: func.now(),
+                    PurchaseOrder.deleted_seq: change_seq,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return updated > 0
+
+    @staticmethod
+    def soft_delete_batch(db: Session, *, batch_size: int) -> int:
+        change_seq = PurchaseOrderRepository._next_change_seq(db)
+        batch = (
+            select(PurchaseOrder.id)
+            .where(PurchaseOrder.deleted_at.is_(None))
+            .order_by(PurchaseOrder.id.asc())
+            .limit(batch_size)
+        )
+        updated = (
+            db.query(PurchaseOrder)
+            .filter(PurchaseOrder.id.in_(batch))
+            .update(
+                {
+                    PurchaseOrder.deleted_at: func.now(),
+                    PurchaseOrder.deleted_seq: change_seq,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return updated
+
+    @staticmethod
+    def purge_deleted_batch(
+        db: Session,
+        *,
+        deleted_before: datetime,
+        batch_size: int,
+    ) -> int:
+        batch = (
+            select(PurchaseOrder.id)
+            .where(
+                PurchaseOrder.deleted_at.is_not(None),
+                PurchaseOrder.deleted_at < deleted_before,
+            )
+            .order_by(PurchaseOrder.id.asc())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        deleted = (
+            db.query(PurchaseOrder)
+            .filter(PurchaseOrder.id.in_(batch))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return deleted
@@ -1,7 +1,10 @@
 from .purchase_orders import (  # noqa: F401
+    MAX_ORDER_ID,
     PurchaseOrderBase,
+    PurchaseOrderBatchItem,
+    PurchaseOrderBatchRequest,
+    PurchaseOrderBatchResponse,
     PurchaseOrderCreate,
     PurchaseOrderCursorPage,
     PurchaseOrderResponse,
 )
-
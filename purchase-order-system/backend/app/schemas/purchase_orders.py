@@ -1,7 +1,14 @@
+import math
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, conint, field_validator, model_validator
+
+from app.core.money import MAX_UNIT_PRICE_CENTS, from_cents, to_cents
+
+# purchase_orders.id is a 32-bit INTEGER column.
+MAX_ORDER_ID = 2**31 - 1
+OrderId = conint(ge=0, le=MAX_ORDER_ID)
 
 
 class PurchaseOrderBase(BaseModel):
@@ -13,7 +20,20 @@ class PurchaseOrderBase(BaseModel):
 
 
 class PurchaseOrderCreate(PurchaseOrderBase):
-    pass
+    @field_validator("unit_price")
+    @classmethod
+    def validate_unit_price(cls, value: float) -> float:
+        # Only the magnitude is bounded: negative prices (credits) are allowed.
+        if not math.isfinite(value) or abs(value) * 100 > MAX_UNIT_PRICE_CENTS:
+            raise ValueError("unit_price is out of range")
+        if abs(to_cents(value)) > MAX_UNIT_PRICE_CENTS:
+            raise ValueError("unit_price is out of range")
+        return value
+
+    def to_db_values(self) -> Dict[str, Any]:
+        values = self.model_dump()
+        values["unit_price_cents"] = to_cents(values.pop("unit_price"))
+        return values
 
 
 class PurchaseOrderResponse(PurchaseOrderBase):
@@ -23,9 +43,37 @@ class PurchaseOrderResponse(PurchaseOrderBase):
     class Config:
         from_attributes = True
 
+    @model_validator(mode="before")
+    @classmethod
+    def convert_minor_units(cls, data: Any) -> Any:
+        if not hasattr(data, "unit_price_cents"):
+            return data
+
+        values = {
+            name: getattr(data, name)
+            for name in cls.model_fields
+            if name not in ("unit_price", "total_price")
+        }
+        values["unit_price"] = from_cents(data.unit_price_cents)
+        values["total_price"] = from_cents(data.total_price_cents)
+        return values
+
 
 class PurchaseOrderCursorPage(BaseModel):
     items: List[PurchaseOrderResponse]
     next_cursor: Optional[str] = None
     has_more: bool = False
 
+
+class PurchaseOrderBatchRequest(BaseModel):
+    ids: List[OrderId]
+
+
+class PurchaseOrderBatchItem(BaseModel):
+    id: int
+    found: bool
+    order: Optional[PurchaseOrderResponse] = None
+
+
+class PurchaseOrderBatchResponse(BaseModel):
+    items: List[PurchaseOrderBatchItem]
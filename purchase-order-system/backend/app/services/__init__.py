@@ -1,2 +1,2 @@
+from .compaction import CompactionWorker, OrderCompactionService  # noqa: F401
 from .purchase_orders import PurchaseOrderService  # noqa: F401
-
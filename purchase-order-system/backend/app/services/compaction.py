@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.repositories import PurchaseOrderRepository
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key shared by every process that may run compaction.
+COMPACTION_LOCK_KEY = 726031
+
+
+@contextmanager
+def compaction_lock() -> Iterator[bool]:
+    """
+    Try to take the database-wide compaction lock; yields whether it was acquired.
+
+    With several uvicorn workers (and cron running scripts/db_compact.py) only
+    the holder compacts, so the configured batch size and pause are not
+    multiplied by the number of processes.
+    """
+    if engine.dialect.name != "postgresql":
+        yield True
+        return
+
+    with engine.connect() as conn:
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"),
+            {"key": COMPACTION_LOCK_KEY},
+        ).scalar()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": COMPACTION_LOCK_KEY},
+                )
+
+
+def in_compaction_window(now: Optional[datetime] = None) -> bool:
+    """Return True if the local hour falls inside the configured off-peak window."""
+    hour = (now or datetime.now()).hour
+    start = settings.compaction_window_start_hour
+    end = settings.compaction_window_end_hour
+    if start == end:
+        return True
+    if start < end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+class OrderCompactionService:
+    @staticmethod
+    def compact(
+        *,
+        batch_size: int,
+        pause_seconds: float,
+        grace_seconds: int,
+        max_batches: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        Hard-delete soft-deleted purchase orders in small, throttled batches.
+
+        Each batch runs in its own short transaction. Only tombstones older
+        than ``grace_seconds`` are removed, so rows deleted moments ago stay
+        out of list results without being reclaimed underneath readers.
+        Returns 0 without doing anything if another process is compacting.
+        """
+        with compaction_lock() as acquired:
+            if not acquired:
+                logger.info("Compaction already running in another process")
+                return 0
+            return OrderCompactionService._purge(
+                batch_size=batch_size,
+                pause_seconds=pause_seconds,
+                grace_seconds=grace_seconds,
+                max_batches=max_batches,
+                stop_event=stop_event,
+            )
+
+    @staticmethod
+    def _purge(
+        *,
+        batch_size: int,
+        pause_seconds: float,
+        grace_seconds: int,
+        max_batches: Optional[int],
+        stop_event: Optional[threading.Event],
+    ) -> int:
+        # Never reclaim tombstones that a live snapshot cursor may still see.
+        # deleted_at and snapshot times come from the database clock, so the
+        # cutoff is computed on it as well.
+        grace_seconds = max(grace_seconds, settings.snapshot_max_age_seconds)
+        db = SessionLocal()
+        try:
+            now = PurchaseOrderRepository.get_database_time(db)
+        finally:
+            db.close()
+        deleted_before = now - timedelta(seconds=grace_seconds)
+        total_deleted = 0
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            if stop_event is not None and stop_event.is_set():
+                break
+
+            db = SessionLocal()
+            try:
+                deleted = PurchaseOrderRepository.purge_deleted_batch(
+                    db,
+                    deleted_before=deleted_before,
+                    batch_size=batch_size,
+                )
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+            total_deleted += deleted
+            batches += 1
+            if deleted < batch_size:
+                break
+
+            if stop_event is not None:
+                stop_event.wait(pause_seconds)
+            else:
+                time.sleep(pause_seconds)
+
+        return total_deleted
+
+
+class CompactionWorker(threading.Thread):
+    """Background thread that periodically runs compaction during off-peak hours."""
+
+    def __init__(self) -> None:
+        super().__init__(name="order-compaction", daemon=True)
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            if in_compaction_window():
+                try:
+                    deleted = OrderCompactionService.compact(
+                        batch_size=settings.compaction_batch_size,
+                        pause_seconds=settings.compaction_batch_pause_seconds,
+                        grace_seconds=settings.compaction_grace_seconds,
+                        stop_event=self._stop_event,
+                    )
+                    if deleted:
+                        logger.info("Compacted %d deleted purchase orders", deleted)
+                except Exception:
+                    logger.exception("Purchase order compaction failed")
+            self._stop_event.wait(settings.compaction_interval_seconds)
+
+    def stop(self) -> None:
+        self._stop_event.set()
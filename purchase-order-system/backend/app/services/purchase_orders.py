@@ -1,11 +1,21 @@
-from typing import Optional
+from datetime import timedelta
+from typing import List, Optional
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.pagination import decode_cursor, encode_cursor
+from app.core.config import settings
+from app.core.page_cache import SharedPageCache, invalidate_pages
+from app.core.pagination import (
+    CursorSnapshot,
+    decode_cursor,
+    encode_cursor,
+    require_cursor_secret,
+)
 from app.repositories import PurchaseOrderRepository
 from app.schemas import (
+    PurchaseOrderBatchItem,
+    PurchaseOrderBatchResponse,
     PurchaseOrderCreate,
     PurchaseOrderCursorPage,
     PurchaseOrderResponse,
@@ -23,20 +33,35 @@ class PurchaseOrderService:
         *,
         cursor: Optional[str],
         limit: int,
+        snapshot: bool = False,
     ) -> PurchaseOrderCursorPage:
         last_id: Optional[int] = None
+        snapshot_state: Optional[CursorSnapshot] = None
         if cursor:
-            last_id = decode_cursor(cursor)
+            last_id, snapshot_state = decode_cursor(cursor)
+        elif snapshot:
+            require_cursor_secret()
+            snapshot_state = PurchaseOrderRepository.get_snapshot(db)
+
+        if cursor and snapshot_state is not None:
+            # as_of comes from the database clock, so age it on that clock too.
+            max_age = timedelta(seconds=settings.snapshot_max_age_seconds)
+            now = PurchaseOrderRepository.get_database_time(db)
+            if now - snapshot_state.as_of > max_age:
+                raise HTTPException(status_code=410, detail="Snapshot expired")
 
         records = PurchaseOrderRepository.list_orders(
             db,
             last_id=last_id,
             limit=limit,
+            snapshot=snapshot_state,
         )
 
         has_more = len(records) > limit
-        next_cursor = encode_cursor(records[limit].id) if has_more else None
         items = records[:limit] if has_more else records
+        next_cursor = (
+            encode_cursor(items[-1].id, snapshot_state) if has_more else None
+        )
 
         return PurchaseOrderCursorPage(
             items=items,
@@ -44,6 +69,30 @@ class PurchaseOrderService:
             has_more=has_more,
         )
 
+    @staticmethod
+    def is_snapshot_request(*, cursor: Optional[str], snapshot: bool) -> bool:
+        if snapshot:
+            return True
+        return bool(cursor) and decode_cursor(cursor)[1] is not None
+
+    @staticmethod
+    def render_cursor_page(
+        db: Session,
+        page_cache: SharedPageCache,
+        *,
+        cursor: Optional[str],
+        limit: int,
+    ) -> bytes:
+        def render() -> bytes:
+            page = PurchaseOrderService.list_orders_with_cursor(
+                db,
+                cursor=cursor,
+                limit=limit,
+            )
+            return page.model_dump_json().encode("utf-8")
+
+        return page_cache.get_or_render(f"{cursor or ''}:{limit}", render)
+
     @staticmethod
     def get_order_or_404(
         db: Session,
@@ -54,20 +103,58 @@ class PurchaseOrderService:
             raise HTTPException(status_code=404, detail="Purchase order not found")
         return order
 
+    @staticmethod
+    def get_orders_batch(
+        db: Session,
+        order_ids: List[int],
+    ) -> PurchaseOrderBatchResponse:
+        if not order_ids:
+            raise HTTPException(status_code=400, detail="No ids provided")
+        if len(order_ids) > settings.batch_max_ids:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many ids (maximum is {settings.batch_max_ids})",
+            )
+
+        unique_ids = list(dict.fromkeys(order_ids))
+        orders = {
+            order.id: order
+            for order in PurchaseOrderRepository.get_orders(db, unique_ids)
+        }
+
+        return PurchaseOrderBatchResponse(
+            items=[
+                PurchaseOrderBatchItem(
+                    id=order_id,
+                    found=order_id in orders,
+                    order=orders.get(order_id),
+                )
+                for order_id in order_ids
+            ]
+        )
+
     @staticmethod
     def create_order(
         db: Session,
         order: PurchaseOrderCreate,
     ) -> PurchaseOrderResponse:
-        return PurchaseOrderRepository.create_order(db, order)
+        created = PurchaseOrderRepository.create_order(db, order)
+        invalidate_pages()
+        return created
 
     @staticmethod
     def delete_order(
         db: Session,
         order_id: int,
     ) -> None:
+        if settings.soft_delete_enabled:
+            if not PurchaseOrderRepository.soft_delete_order(db, order_id):
+                raise HTTPException(status_code=404, detail="Purchase order not found")
+            invalidate_pages()
+            return
+
         order = PurchaseOrderRepository.get_order(db, order_id)
         if not order:
             raise HTTPException(status_code=404, detail="Purchase order not found")
         PurchaseOrderRepository.delete_order(db, order)
-
+        invalidate_pages()
@@ -1,14 +1,38 @@
-from fastapi import FastAPI
+import math
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api import api_router
 from app.core.config import settings
+from app.core.page_cache import invalidate_pages
 from app.db import Base, engine
+from app.services import CompactionWorker
 import app.db.models  # noqa: F401
 
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title=settings.project_name)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Pages cached by a previous deploy may have been rendered by older code.
+    invalidate_pages()
+    worker = None
+    if settings.compaction_enabled:
+        worker = CompactionWorker()
+        worker.start()
+    try:
+        yield
+    finally:
+        if worker is not None:
+            worker.stop()
+
+
+app = FastAPI(title=settings.project_name, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,6 +43,19 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(
+    request: Request,
+    exc: RequestValidationError,
+) -> JSONResponse:
+    # Errors echo the rejected input, which may be NaN or Infinity.
+    errors = jsonable_encoder(
+        exc.errors(),
+        custom_encoder={float: lambda value: value if math.isfinite(value) else str(value)},
+    )
+    return JSONResponse(status_code=422, content={"detail": errors})
+
+
 @app.get("/")
 def read_root() -> dict[str, str]:
     return {"message": settings.project_name}
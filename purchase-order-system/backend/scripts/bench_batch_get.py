@@ -0,0 +1,75 @@
+import os
+import argparse
+import json
+import time
+import urllib.request
+
+API_URL = os.getenv("API_URL", "http://localhost:8000")
+
+def fetch_json(url, payload=None):
+    """GET (or POST when a payload is given) a URL and decode the JSON response"""
+    data = None
+    headers = {}
+    if payload is not None:
+        data = json.dumps(payload).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    request = urllib.request.Request(url, data=data, headers=headers)
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+def collect_ids(count):
+    """Collect existing order ids by walking the cursor endpoint"""
+    ids = []
+    cursor = None
+    while len(ids) < count:
+        url = f"{API_URL}/api/purchase-orders/cursor?limit=200"
+        if cursor:
+            url += f"&cursor={cursor}"
+        page = fetch_json(url)
+        ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+    return ids[:count]
+
+def time_single_gets(ids):
+    start = time.perf_counter()
+    for order_id in ids:
+        fetch_json(f"{API_URL}/api/purchase-orders/{order_id}")
+    return time.perf_counter() - start
+
+def time_batch_get(ids):
+    start = time.perf_counter()
+    fetch_json(f"{API_URL}/api/purchase-orders/batch?ids={','.join(map(str, ids))}")
+    return time.perf_counter() - start
+
+def time_batch_post(ids):
+    start = time.perf_counter()
+    fetch_json(f"{API_URL}/api/purchase-orders/batch", {"ids": ids})
+    return time.perf_counter() - start
+
+def main():
+    """Compare N single-order GETs against one batched multi-get against a running API"""
+    parser = argparse.ArgumentParser(description="Benchmark batched order multi-get")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200, 500])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    ids = collect_ids(max(args.sizes))
+    if not ids:
+        print("\n✗ No purchase orders found. Run scripts/db_populate.py first.")
+        return
+
+    print(f"\nAPI: {API_URL}, rounds per size: {args.rounds}\n")
+    print(f"  {'ids':>6s} {'single GETs':>14s} {'batch GET':>12s} {'batch POST':>12s} {'speedup':>9s}")
+    for size in args.sizes:
+        sample = ids[:size]
+        single = min(time_single_gets(sample) for _ in range(args.rounds))
+        batch_get = min(time_batch_get(sample) for _ in range(args.rounds))
+        batch_post = min(time_batch_post(sample) for _ in range(args.rounds))
+        print(f"  {len(sample):>6d} {single * 1000:>11.1f} ms {batch_get * 1000:>9.1f} ms "
+              f"{batch_post * 1000:>9.1f} ms {single / min(batch_get, batch_post):>8.1f}x")
+    print()
+
+if __name__ == "__main__":
+    main()
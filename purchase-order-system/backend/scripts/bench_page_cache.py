@@ -0,0 +1,134 @@
+import sys
+import os
+import argparse
+import multiprocessing
+import random
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import date
+from app.core.page_cache import SharedPageCache
+from app.schemas import PurchaseOrderCursorPage
+
+PAGE_KEY = ":50"
+SLOT_COUNT = 64
+SLOT_SIZE = 65536
+
+def render_page(limit, db_latency):
+    """Simulate a cache miss: the database round trip plus page serialization"""
+    time.sleep(db_latency)
+    items = [
+        {
+            "id": i,
+            "item_name": f"Item {i}",
+            "order_date": date(2025, 1, 1),
+            "delivery_date": date(2025, 1, 15),
+            "quantity": 10,
+            "unit_price": 19.99,
+            "total_price": 199.9,
+        }
+        for i in range(1, limit + 1)
+    ]
+    page = PurchaseOrderCursorPage(items=items, next_cursor="NTE", has_more=True)
+    return page.model_dump_json().encode("utf-8")
+
+def run_worker(mode, path, requests, write_ratio, db_latency, interval, seed, results):
+    """
+    Serve the first cursor page ``requests`` times.
+    Both modes share the generation counter for invalidation; only where the
+    page bytes are stored differs.
+    """
+    random.seed(seed)
+    cache = SharedPageCache(path, slot_count=SLOT_COUNT, slot_size=SLOT_SIZE)
+    local_pages = {}
+    renders = 0
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        time.sleep(interval)
+        if random.random() < write_ratio:
+            cache.bump_generation()
+            continue
+
+        if mode == "shared":
+            def render():
+                nonlocal renders
+                renders += 1
+                return render_page(50, db_latency)
+
+            cache.get_or_render(PAGE_KEY, render)
+        else:
+            generation = cache.generation()
+            cached = local_pages.get(PAGE_KEY)
+            if cached is None or cached[0] != generation:
+                payload = render_page(50, db_latency)
+                renders += 1
+                local_pages[PAGE_KEY] = (generation, payload)
+    elapsed = time.perf_counter() - start
+
+    resident = sum(len(payload) for _, payload in local_pages.values())
+    if mode == "shared":
+        payload = cache.get(PAGE_KEY)
+        resident = len(payload) if payload is not None else 0
+    cache.close()
+    results.put((renders, elapsed, resident))
+
+def run_benchmark(mode, workers, requests, write_ratio, db_latency, interval):
+    """Run one mode across ``workers`` processes and aggregate their results"""
+    fd, path = tempfile.mkstemp(prefix="page_cache_bench_", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    os.close(fd)
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(
+            target=run_worker,
+            args=(mode, path, requests, write_ratio, db_latency, interval, seed, results),
+        )
+        for seed in range(workers)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        worker_results = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        os.unlink(path)
+
+    renders = sum(r[0] for r in worker_results)
+    elapsed = max(r[1] for r in worker_results)
+    # Shared pages are stored once per host; per-worker pages once per process
+    if mode == "shared":
+        resident = max(r[2] for r in worker_results)
+    else:
+        resident = sum(r[2] for r in worker_results)
+    throughput = workers * requests / elapsed if elapsed else 0
+    return renders, throughput, resident
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare shared vs per-worker page caching")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--write-ratio", type=float, default=0.01,
+                        help="Fraction of requests that create/delete an order")
+    parser.add_argument("--db-latency", type=float, default=0.002,
+                        help="Simulated seconds per database query on a miss")
+    parser.add_argument("--interval", type=float, default=0.001,
+                        help="Seconds between requests on each worker")
+    args = parser.parse_args()
+
+    print(f"\nWorkers: {args.workers}, requests/worker: {args.requests:,}, "
+          f"write ratio: {args.write_ratio:.2%}, db latency: {args.db_latency * 1000:.1f} ms, "
+          f"interval: {args.interval * 1000:.1f} ms\n")
+    print(f"  {'mode':12s} {'renders':>10s} {'req/s':>12s} {'cache bytes':>14s}")
+    for mode in ("per-worker", "shared"):
+        renders, throughput, resident = run_benchmark(
+            mode, args.workers, args.requests, args.write_ratio, args.db_latency,
+            args.interval,
+        )
+        print(f"  {mode:12s} {renders:>10,} {throughput:>12,.0f} {resident:>14,}")
+    print()
+
+if __name__ == "__main__":
+    main()
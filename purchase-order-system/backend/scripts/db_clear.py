@@ -2,10 +2,43 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.core.config import settings
+from app.core.page_cache import invalidate_pages
 from app.db.session import SessionLocal
 from app.db.models import PurchaseOrder
+from app.repositories import PurchaseOrderRepository
 from sqlalchemy import func
 
+SOFT_DELETE_BATCH_SIZE = 10000
+
+def count_orders(db):
+    """Count purchase orders that have not been soft-deleted"""
+    return db.query(func.count(PurchaseOrder.id)).filter(
+        PurchaseOrder.deleted_at.is_(None)
+    ).scalar()
+
+def delete_all_orders(db):
+    """
+    Delete all purchase orders.
+    With soft delete enabled, rows are tombstoned in batches and left for
+    the compaction job (scripts/db_compact.py) to hard-delete off-peak.
+    """
+    if settings.soft_delete_enabled:
+        deleted_count = 0
+        while True:
+            updated = PurchaseOrderRepository.soft_delete_batch(
+                db, batch_size=SOFT_DELETE_BATCH_SIZE
+            )
+            deleted_count += updated
+            if updated < SOFT_DELETE_BATCH_SIZE:
+                break
+    else:
+        deleted_count = db.query(PurchaseOrder).delete()
+        db.commit()
+
+    invalidate_pages()
+    return deleted_count
+
 def clear_database():
     """
     Clear all purchase orders from the database.
@@ -15,7 +48,7 @@ def clear_database():
 
     try:
         # Get current count
-        count = db.query(func.count(PurchaseOrder.id)).scalar()
+        count = count_orders(db)
 
         if count == 0:
             print("\n✓ Database is already empty. No records to delete.")
@@ -33,8 +66,7 @@ def clear_database():
 
         # Delete all records
         print("\nDeleting records...")
-        deleted_count = db.query(PurchaseOrder).delete()
-        db.commit()
+        deleted_count = delete_all_orders(db)
 
         print(f"\n✓ Successfully deleted {deleted_count:,} purchase orders from the database.")
         print("Database is now empty.\n")
@@ -50,10 +82,9 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == '--force':
         db = SessionLocal()
         try:
-            count = db.query(func.count(PurchaseOrder.id)).scalar()
+            count = count_orders(db)
             if count > 0:
-                deleted_count = db.query(PurchaseOrder).delete()
-                db.commit()
+                deleted_count = delete_all_orders(db)
                 print(f"\n✓ Force deleted {deleted_count:,} purchase orders.")
             else:
                 print("\n✓ Database is already empty.")
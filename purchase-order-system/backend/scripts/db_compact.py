@@ -0,0 +1,48 @@
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.compaction import OrderCompactionService, in_compaction_window
+
+def main():
+    """
+    Hard-delete soft-deleted purchase orders in throttled batches.
+    Intended to be run from cron during off-peak hours.
+    """
+    parser = argparse.ArgumentParser(description="Compact soft-deleted purchase orders")
+    parser.add_argument("--batch-size", type=int, default=settings.compaction_batch_size,
+                        help="Rows hard-deleted per transaction")
+    parser.add_argument("--pause", type=float, default=settings.compaction_batch_pause_seconds,
+                        help="Seconds to sleep between batches")
+    parser.add_argument("--grace", type=int, default=settings.compaction_grace_seconds,
+                        help="Only remove rows deleted at least this many seconds ago")
+    parser.add_argument("--max-batches", type=int, default=None,
+                        help="Stop after this many batches")
+    parser.add_argument("--ignore-window", action="store_true",
+                        help="Run even outside the configured off-peak window")
+    args = parser.parse_args()
+
+    if not args.ignore_window and not in_compaction_window():
+        print("\n✗ Outside the compaction window "
+              f"({settings.compaction_window_start_hour:02d}:00-"
+              f"{settings.compaction_window_end_hour:02d}:00). Use --ignore-window to override.")
+        return
+
+    print(f"\nCompacting deleted purchase orders (batch size: {args.batch_size:,})...")
+    try:
+        deleted_count = OrderCompactionService.compact(
+            batch_size=args.batch_size,
+            pause_seconds=args.pause,
+            grace_seconds=args.grace,
+            max_batches=args.max_batches,
+        )
+    except Exception as e:
+        print(f"\n✗ Error occurred: {e}")
+        return
+
+    print(f"\n✓ Hard-deleted {deleted_count:,} soft-deleted purchase orders.\n")
+
+if __name__ == "__main__":
+    main()
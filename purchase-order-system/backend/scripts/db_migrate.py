@@ -0,0 +1,183 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.page_cache import invalidate_pages
+from app.db import Base
+from app.db.models import ChangeSequence
+from app.db.session import engine
+from sqlalchemy import inspect, text
+
+BACKFILL_BATCH_SIZE = 10000
+
+def add_soft_delete():
+    """
+    Add the deleted_at tombstone column and the partial index over live rows.
+    Both statements are idempotent; the index is built CONCURRENTLY so the
+    table stays writable while it is created. A failed concurrent build
+    leaves an INVALID index behind, which is dropped and rebuilt.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(
+            "ALTER TABLE purchase_orders "
+            "ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE"
+        ))
+        invalid = conn.execute(text(
+            "SELECT 1 FROM pg_index "
+            "WHERE indexrelid = to_regclass('ix_purchase_orders_live_id') "
+            "AND NOT indisvalid"
+        )).first()
+        if invalid is not None:
+            print("Rebuilding invalid index ix_purchase_orders_live_id...")
+            conn.execute(text(
+                "DROP INDEX CONCURRENTLY IF EXISTS ix_purchase_orders_live_id"
+            ))
+        conn.execute(text(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_purchase_orders_live_id "
+            "ON purchase_orders (id) WHERE deleted_at IS NULL"
+        ))
+    print("✓ Soft delete column and partial index are in place.")
+
+def add_change_sequence():
+    """
+    Add the change_sequence counter and the deleted_seq stamp on tombstones.
+    Existing tombstones keep a NULL deleted_seq, which snapshots treat as
+    deleted before they were pinned.
+    """
+    Base.metadata.create_all(bind=engine, tables=[ChangeSequence.__table__])
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(
+            "INSERT INTO change_sequence (id, value) VALUES (1, 0) "
+            "ON CONFLICT (id) DO NOTHING"
+        ))
+        conn.execute(text(
+            "ALTER TABLE purchase_orders "
+            "ADD COLUMN IF NOT EXISTS deleted_seq BIGINT"
+        ))
+    print("✓ Change sequence is in place.")
+
+def _has_column(conn, column):
+    return conn.execute(text(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'purchase_orders' AND column_name = :column"
+    ), {"column": column}).first() is not None
+
+def convert_prices_to_cents(batch_size=BACKFILL_BATCH_SIZE):
+    """
+    Move unit_price/total_price from FLOAT to integer cents.
+
+    Runs in two phases:
+
+    1. Online: unit_price_cents is backfilled in id-range batches, one short
+       transaction each. Code from before this migration can keep serving
+       during this phase; rows it inserts meanwhile only carry the float
+       price and are caught up afterwards, with a final pass under a brief
+       write lock together with SET NOT NULL.
+    2. Maintenance window: the float columns are dropped, which breaks code
+       from before this migration, and total_price_cents is added as a
+       stored generated column. PostgreSQL rewrites the whole table under an
+       ACCESS EXCLUSIVE lock for that step, blocking all reads and writes
+       until it finishes. On a large table, stop the app first (the compose
+       and Dockerfile startup chains already run this script before the API
+       starts).
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if _has_column(conn, "total_price_cents"):
+            print("✓ Prices are already stored in cents.")
+            return
+
+        conn.execute(text(
+            "ALTER TABLE purchase_orders "
+            "ADD COLUMN IF NOT EXISTS unit_price_cents INTEGER"
+        ))
+
+        if _has_column(conn, "unit_price"):
+            min_id, max_id = conn.execute(text(
+                "SELECT MIN(id), MAX(id) FROM purchase_orders"
+            )).one()
+            if min_id is not None:
+                for start in range(min_id - 1, max_id, batch_size):
+                    end = min(start + batch_size, max_id)
+                    conn.execute(text(
+                        "UPDATE purchase_orders "
+                        "SET unit_price_cents = ROUND(unit_price::numeric * 100) "
+                        "WHERE id > :start AND id <= :end "
+                        "AND unit_price_cents IS NULL"
+                    ), {"start": start, "end": end})
+                    progress = (end - min_id + 1) / (max_id - min_id + 1) * 100
+                    print(f"Backfill progress: {progress:.1f}%")
+
+            # Catch up rows that pre-migration code inserted during the backfill.
+            while True:
+                result = conn.execute(text(
+                    "UPDATE purchase_orders "
+                    "SET unit_price_cents = ROUND(unit_price::numeric * 100) "
+                    "WHERE id IN ("
+                    "SELECT id FROM purchase_orders "
+                    "WHERE unit_price_cents IS NULL LIMIT :batch_size)"
+                ), {"batch_size": batch_size})
+                if result.rowcount == 0:
+                    break
+                print(f"Caught up {result.rowcount:,} rows inserted during the backfill")
+
+        # Block writes only for the final pass so no NULL row slips in
+        # between it and SET NOT NULL.
+        with engine.begin() as tx:
+            tx.execute(text(
+                "LOCK TABLE purchase_orders IN SHARE ROW EXCLUSIVE MODE"
+            ))
+            if _has_column(tx, "unit_price"):
+                tx.execute(text(
+                    "UPDATE purchase_orders "
+                    "SET unit_price_cents = ROUND(unit_price::numeric * 100) "
+                    "WHERE unit_price_cents IS NULL"
+                ))
+            tx.execute(text(
+                "ALTER TABLE purchase_orders ALTER COLUMN unit_price_cents SET NOT NULL"
+            ))
+        # Phase 2: needs a maintenance window, see the docstring.
+        print("Rewriting purchase_orders with the generated total; "
+              "the table is locked until this finishes...")
+        conn.execute(text(
+            "ALTER TABLE purchase_orders "
+            "DROP COLUMN IF EXISTS unit_price, "
+            "DROP COLUMN IF EXISTS total_price"
+        ))
+        conn.execute(text(
+            "ALTER TABLE purchase_orders "
+            "ADD COLUMN total_price_cents BIGINT NOT NULL "
+            "GENERATED ALWAYS AS (CAST(quantity AS BIGINT) * unit_price_cents) STORED"
+        ))
+    print("✓ Prices converted to integer cents.")
+
+MIGRATIONS = [
+    add_soft_delete,
+    add_change_sequence,
+    convert_prices_to_cents,
+]
+
+def run_migrations():
+    """
+    Apply schema changes to an existing PostgreSQL database.
+    A fresh database gets the current schema directly instead.
+    Returns False if a migration failed.
+    """
+    print("\nApplying migrations...")
+    try:
+        if not inspect(engine).has_table("purchase_orders"):
+            Base.metadata.create_all(bind=engine)
+            print("✓ Created the current schema on an empty database.")
+        else:
+            for migration in MIGRATIONS:
+                migration()
+    except Exception as e:
+        print(f"\n✗ Error occurred: {e}")
+        return False
+    finally:
+        invalidate_pages()
+    print("\n✓ Database schema is up to date.\n")
+    return True
+
+if __name__ == "__main__":
+    if not run_migrations():
+        sys.exit(1)
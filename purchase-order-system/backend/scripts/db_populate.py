@@ -4,6 +4,7 @@ import random
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.core.page_cache import invalidate_pages
 from app.db.session import SessionLocal
 from app.db.models import PurchaseOrder
 from datetime import date, timedelta
@@ -53,19 +54,16 @@ def add_entries(total_entries, batch_size=10000):
                 # Random quantity (1-100)
                 quantity = random.randint(1, 100)
 
-                # Random unit price ($10-$2000)
-                unit_price = round(random.uniform(10.0, 2000.0), 2)
-
-                # Calculate total
-                total_price = round(quantity * unit_price, 2)
+                # Random unit price ($10-$2000) in cents; the total is
+                # computed by the database
+                unit_price_cents = random.randint(1000, 200000)
 
                 order = PurchaseOrder(
                     item_name=item_name,
                     order_date=order_date,
                     delivery_date=delivery_date,
                     quantity=quantity,
-                    unit_price=unit_price,
-                    total_price=total_price
+                    unit_price_cents=unit_price_cents
                 )
                 batch.append(order)
 
@@ -83,6 +81,8 @@ def add_entries(total_entries, batch_size=10000):
         print(f"\n✗ Error occurred: {e}")
         db.rollback()
     finally:
+        # Committed batches are visible even if a later one failed
+        invalidate_pages()
         db.close()
 
 if __name__ == "__main__":
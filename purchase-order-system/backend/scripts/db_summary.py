@@ -2,14 +2,18 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.core.money import cents_to_decimal
 from app.db.session import SessionLocal
 from app.db.models import PurchaseOrder
 from sqlalchemy import func, extract
 from datetime import datetime
 
-def format_currency(amount):
-    """Format number as currency"""
-    return f"${amount:,.2f}"
+# Soft-deleted rows are excluded until compaction removes them
+LIVE = PurchaseOrder.deleted_at.is_(None)
+
+def format_currency(cents):
+    """Format an amount in cents (or an exact aggregate of cents) as currency"""
+    return f"${cents_to_decimal(cents):,.2f}"
 
 def format_number(num):
     """Format number with thousand separators"""
@@ -24,8 +28,29 @@ def print_summary():
         print("PURCHASE ORDER DATABASE SUMMARY".center(70))
         print("="*70 + "\n")
 
-        # Total count
-        total_count = db.query(func.count(PurchaseOrder.id)).scalar()
+        # Count, financial and quantity aggregates in a single pass
+        (
+            total_count,
+            total_value,
+            avg_order_value,
+            min_order,
+            max_order,
+            total_items,
+            avg_quantity,
+            min_quantity,
+            max_quantity,
+        ) = db.query(
+            func.count(PurchaseOrder.id),
+            func.sum(PurchaseOrder.total_price_cents),
+            func.avg(PurchaseOrder.total_price_cents),
+            func.min(PurchaseOrder.total_price_cents),
+            func.max(PurchaseOrder.total_price_cents),
+            func.sum(PurchaseOrder.quantity),
+            func.avg(PurchaseOrder.quantity),
+            func.min(PurchaseOrder.quantity),
+            func.max(PurchaseOrder.quantity),
+        ).filter(LIVE).one()
+
         print(f"📊 Total Purchase Orders: {format_number(total_count)}\n")
 
         if total_count == 0:
@@ -37,11 +62,6 @@ def print_summary():
         print("💰 FINANCIAL SUMMARY")
         print("-" * 70)
 
-        total_value = db.query(func.sum(PurchaseOrder.total_price)).scalar() or 0
-        avg_order_value = db.query(func.avg(PurchaseOrder.total_price)).scalar() or 0
-        min_order = db.query(func.min(PurchaseOrder.total_price)).scalar() or 0
-        max_order = db.query(func.max(PurchaseOrder.total_price)).scalar() or 0
-
         print(f"  Total Order Value:    {format_currency(total_value)}")
         print(f"  Average Order Value:  {format_currency(avg_order_value)}")
         print(f"  Minimum Order Value:  {format_currency(min_order)}")
@@ -53,11 +73,6 @@ def print_summary():
         print("📦 QUANTITY SUMMARY")
         print("-" * 70)
 
-        total_items = db.query(func.sum(PurchaseOrder.quantity)).scalar() or 0
-        avg_quantity = db.query(func.avg(PurchaseOrder.quantity)).scalar() or 0
-        min_quantity = db.query(func.min(PurchaseOrder.quantity)).scalar() or 0
-        max_quantity = db.query(func.max(PurchaseOrder.quantity)).scalar() or 0
-
         print(f"  Total Items Ordered:  {format_number(total_items)}")
         print(f"  Average Quantity:     {format_number(int(avg_quantity))}")
         print(f"  Minimum Quantity:     {format_number(min_quantity)}")
@@ -73,7 +88,9 @@ def print_summary():
             PurchaseOrder.item_name,
             func.count(PurchaseOrder.id).label('order_count'),
             func.sum(PurchaseOrder.quantity).label('total_quantity'),
-            func.sum(PurchaseOrder.total_price).label('total_value')
+            func.sum(PurchaseOrder.total_price_cents).label('total_value')
+        ).filter(
+            LIVE
         ).group_by(
             PurchaseOrder.item_name
         ).order_by(
@@ -92,12 +109,14 @@ def print_summary():
 
         top_revenue = db.query(
             PurchaseOrder.item_name,
-            func.sum(PurchaseOrder.total_price).label('total_value'),
+            func.sum(PurchaseOrder.total_price_cents).label('total_value'),
             func.count(PurchaseOrder.id).label('order_count')
+        ).filter(
+            LIVE
         ).group_by(
             PurchaseOrder.item_name
         ).order_by(
-            func.sum(PurchaseOrder.total_price).desc()
+            func.sum(PurchaseOrder.total_price_cents).desc()
         ).limit(10).all()
 
         for idx, (item_name, value, count) in enumerate(top_revenue, 1):
@@ -110,10 +129,10 @@ def print_summary():
         print("📅 DATE RANGE")
         print("-" * 70)
 
-        earliest_order = db.query(func.min(PurchaseOrder.order_date)).scalar()
-        latest_order = db.query(func.max(PurchaseOrder.order_date)).scalar()
-        earliest_delivery = db.query(func.min(PurchaseOrder.delivery_date)).scalar()
-        latest_delivery = db.query(func.max(PurchaseOrder.delivery_date)).scalar()
+        earliest_order = db.query(func.min(PurchaseOrder.order_date)).filter(LIVE).scalar()
+        latest_order = db.query(func.max(PurchaseOrder.order_date)).filter(LIVE).scalar()
+        earliest_delivery = db.query(func.min(PurchaseOrder.delivery_date)).filter(LIVE).scalar()
+        latest_delivery = db.query(func.max(PurchaseOrder.delivery_date)).filter(LIVE).scalar()
 
         print(f"  Earliest Order Date:    {earliest_order}")
         print(f"  Latest Order Date:      {latest_order}")
@@ -129,7 +148,9 @@ def print_summary():
         orders_by_year = db.query(
             extract('year', PurchaseOrder.order_date).label('year'),
             func.count(PurchaseOrder.id).label('count'),
-            func.sum(PurchaseOrder.total_price).label('total_value')
+            func.sum(PurchaseOrder.total_price_cents).label('total_value')
+        ).filter(
+            LIVE
         ).group_by(
             extract('year', PurchaseOrder.order_date)
         ).order_by(
@@ -146,14 +167,14 @@ def print_summary():
         print("🕐 LATEST 5 PURCHASE ORDERS")
         print("-" * 70)
 
-        recent_orders = db.query(PurchaseOrder).order_by(
+        recent_orders = db.query(PurchaseOrder).filter(LIVE).order_by(
             PurchaseOrder.id.desc()
         ).limit(5).all()
 
         for order in recent_orders:
             print(f"  ID {order.id}: {order.item_name} - "
-                  f"{order.quantity} units × {format_currency(order.unit_price)} = "
-                  f"{format_currency(order.total_price)}")
+                  f"{order.quantity} units × {format_currency(order.unit_price_cents)} = "
+                  f"{format_currency(order.total_price_cents)}")
             print(f"         Ordered: {order.order_date}, Delivery: {order.delivery_date}")
         print()
 
@@ -0,0 +1,47 @@
+from datetime import date
+
+import pytest
+
+from app.db.models import PurchaseOrder
+
+
+@pytest.fixture
+def orders(db):
+    orders = [
+        PurchaseOrder(
+            item_name=f"Item {i}",
+            order_date=date(2025, 1, 1),
+            delivery_date=date(2025, 1, 15),
+            quantity=i,
+            unit_price_cents=100,
+        )
+        for i in range(1, 4)
+    ]
+    db.add_all(orders)
+    db.commit()
+    return orders
+
+
+def test_batch_get_returns_items_in_request_order(client, orders):
+    response = client.get("/api/purchase-orders/batch", params={"ids": "3,99,1,3"})
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(item["id"], item["found"]) for item in items] == [
+        (3, True),
+        (99, False),
+        (1, True),
+        (3, True),
+    ]
+    assert items[0]["order"]["total_price"] == 3.0
+
+
+@pytest.mark.parametrize("ids", ["-1", "2147483648", "99999999999999999999", "1,x"])
+def test_batch_get_rejects_ids_outside_the_id_column(client, ids):
+    response = client.get("/api/purchase-orders/batch", params={"ids": ids})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("order_id", [-1, 2**31, 99999999999999999999])
+def test_batch_post_rejects_ids_outside_the_id_column(client, order_id):
+    response = client.post("/api/purchase-orders/batch", json={"ids": [1, order_id]})
+    assert response.status_code == 422
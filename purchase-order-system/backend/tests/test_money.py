@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.money import MAX_UNIT_PRICE_CENTS, from_cents, to_cents
+from app.schemas import PurchaseOrderCreate
+
+
+def make_order(unit_price):
+    return PurchaseOrderCreate(
+        item_name="Widget",
+        order_date=date(2025, 1, 1),
+        delivery_date=date(2025, 1, 15),
+        quantity=3,
+        unit_price=unit_price,
+    )
+
+
+@pytest.mark.parametrize(
+    ("amount", "cents"),
+    [
+        (19.99, 1999),
+        (0.1 + 0.2, 30),
+        (1.005, 101),
+        (2.675, 268),
+        (-1.005, -101),
+        ("12.345", 1235),
+        (7, 700),
+    ],
+)
+def test_to_cents_rounds_half_up_on_the_decimal_value(amount, cents):
+    assert to_cents(amount) == cents
+
+
+@pytest.mark.parametrize("amount", [float("nan"), float("inf"), float("-inf"), "1e999999999"])
+def test_to_cents_rejects_non_finite_and_unquantizable_amounts(amount):
+    with pytest.raises(ValueError):
+        to_cents(amount)
+
+
+def test_from_cents_round_trips():
+    assert from_cents(to_cents(19.99)) == 19.99
+    assert from_cents(-250) == -2.5
+
+
+def test_create_accepts_negative_prices():
+    assert make_order(-5.25).to_db_values()["unit_price_cents"] == -525
+
+
+def test_create_accepts_prices_at_the_column_limit():
+    limit = MAX_UNIT_PRICE_CENTS / 100
+    assert make_order(limit).to_db_values()["unit_price_cents"] == MAX_UNIT_PRICE_CENTS
+    assert make_order(-limit).to_db_values()["unit_price_cents"] == -MAX_UNIT_PRICE_CENTS
+
+
+@pytest.mark.parametrize(
+    "unit_price",
+    [
+        float("nan"),
+        float("inf"),
+        1e300,
+        -1e300,
+        (MAX_UNIT_PRICE_CENTS + 1) / 100,
+        -(MAX_UNIT_PRICE_CENTS + 1) / 100,
+    ],
+)
+def test_create_rejects_out_of_range_prices(unit_price):
+    with pytest.raises(ValidationError):
+        make_order(unit_price)
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from app.core.page_cache import _SEQ, SharedPageCache, _hash_key
+
+
+def make_cache(tmp_path):
+    return SharedPageCache(str(tmp_path / "page_cache"), slot_count=4, slot_size=1024)
+
+
+def test_put_then_get_round_trips(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.put("page", b"payload", cache.generation())
+    assert cache.get("page") == b"payload"
+
+
+def test_slot_left_odd_by_crashed_writer_never_serves_torn_bytes(tmp_path):
+    cache = make_cache(tmp_path)
+    offset = cache._slot_offset(_hash_key("page"))
+    assert cache.put("page", b"old-payload", cache.generation())
+
+    # Simulate a writer killed between starting and finishing its update.
+    seq = _SEQ.unpack_from(cache._mm, offset)[0]
+    _SEQ.pack_into(cache._mm, offset, seq + 1)
+    assert cache.get("page") is None
+
+    # The next write must still be marked in progress while it runs.
+    begin = cache._begin_write(offset)
+    assert begin % 2 == 1
+    assert cache.get("page") is None
+    cache._finish_write(offset, begin)
+
+    assert cache.put("page", b"new-payload", cache.generation())
+    assert _SEQ.unpack_from(cache._mm, offset)[0] % 2 == 0
+    assert cache.get("page") == b"new-payload"
+
+
+def test_bump_generation_invalidates_pages(tmp_path):
+    cache = make_cache(tmp_path)
+    generation = cache.generation()
+    assert cache.put("page", b"payload", generation)
+    cache.bump_generation()
+    assert cache.get("page") is None
+    assert not cache.put("page", b"stale", generation)
+
+
+def test_pages_expire_after_max_age(tmp_path):
+    cache = SharedPageCache(
+        str(tmp_path / "page_cache"),
+        slot_count=4,
+        slot_size=1024,
+        max_age_seconds=0,
+    )
+    assert cache.put("page", b"payload", cache.generation())
+    time.sleep(0.01)
+    assert cache.get("page") is None
+
+
+def test_reopening_with_other_geometry_discards_pages(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.put("page", b"payload", cache.generation())
+
+    reopened = SharedPageCache(str(tmp_path / "page_cache"), slot_count=8, slot_size=1024)
+    assert reopened.get("page") is None
+    assert cache.get("page") is None
+
+
+
+def test_threads_sharing_one_handle_never_interleave_writes(tmp_path):
+    cache = make_cache(tmp_path)
+    offset = cache._slot_offset(_hash_key("page"))
+    payloads = {bytes([i]) * (100 + i * 50) for i in range(8)}
+    active = []
+    overlaps = []
+    torn = []
+    done = threading.Event()
+    begin_write, finish_write = cache._begin_write, cache._finish_write
+
+    # Hold each write open briefly so an unserialized writer would overlap it.
+    def slow_begin_write(offset):
+        active.append(None)
+        if len(active) > 1:
+            overlaps.append(len(active))
+        begin = begin_write(offset)
+        time.sleep(0.0005)
+        return begin
+
+    def slow_finish_write(offset, begin):
+        finish_write(offset, begin)
+        active.pop()
+
+    cache._begin_write = slow_begin_write
+    cache._finish_write = slow_finish_write
+
+    def write(payload):
+        for _ in range(20):
+            cache.put("page", payload, cache.generation())
+
+    def read():
+        while not done.is_set():
+            payload = cache.get("page")
+            if payload is not None and payload not in payloads:
+                torn.append(payload)
+
+    reader = threading.Thread(target=read)
+    writers = [threading.Thread(target=write, args=(p,)) for p in payloads]
+    reader.start()
+    try:
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+    finally:
+        done.set()
+        reader.join()
+
+    assert overlaps == []
+    assert torn == []
+    assert _SEQ.unpack_from(cache._mm, offset)[0] % 2 == 0
+    assert cache.get("page") in payloads
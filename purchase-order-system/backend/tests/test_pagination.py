@@ -0,0 +1,199 @@
+import base64
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.pagination import CursorSnapshot, decode_cursor, encode_cursor
+from app.db.models import PurchaseOrder
+from app.repositories import PurchaseOrderRepository
+from app.services import PurchaseOrderService
+
+
+@pytest.fixture
+def orders(db, monkeypatch):
+    monkeypatch.setattr(settings, "soft_delete_enabled", True)
+    db.add_all(
+        PurchaseOrder(
+            item_name=f"Item {i}",
+            order_date=date(2025, 1, 1),
+            delivery_date=date(2025, 1, 15),
+            quantity=1,
+            unit_price_cents=100,
+        )
+        for i in range(1, 6)
+    )
+    db.commit()
+
+
+SNAPSHOT = CursorSnapshot(
+    max_id=40,
+    as_of=datetime(2025, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+    change_seq=7,
+)
+
+
+def raw(cursor):
+    return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+
+
+def forge(payload):
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def assert_invalid(cursor, detail="Invalid cursor"):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == detail
+
+
+def test_plain_cursor_round_trips_without_a_secret(monkeypatch):
+    monkeypatch.setattr(settings, "cursor_secret", "")
+    assert decode_cursor(encode_cursor(25)) == (25, None)
+
+
+def test_snapshot_cursor_round_trips():
+    assert decode_cursor(encode_cursor(25, SNAPSHOT)) == (25, SNAPSHOT)
+
+
+def test_tampered_snapshot_cursor_is_rejected():
+    order_id, max_id, as_of, change_seq, signature = raw(encode_cursor(25, SNAPSHOT)).split(".")
+
+    assert_invalid(forge(f"{order_id}.999.{as_of}.{change_seq}.{signature}"))
+    assert_invalid(forge(f"{order_id}.{max_id}.{as_of}.0.{signature}"))
+    assert_invalid(forge(f"{order_id}.{max_id}.{as_of}.{change_seq}"))
+    assert_invalid(forge(f"{order_id}.{max_id}.{as_of}.{change_seq}.{'0' * 32}"))
+    assert_invalid("not base64!")
+
+
+def test_snapshot_cursor_signed_with_another_secret_is_rejected(monkeypatch):
+    cursor = encode_cursor(25, SNAPSHOT)
+    monkeypatch.setattr(settings, "cursor_secret", "rotated")
+    assert_invalid(cursor)
+
+
+def test_snapshot_pagination_requires_a_secret(db, monkeypatch):
+    cursor = encode_cursor(25, SNAPSHOT)
+    monkeypatch.setattr(settings, "cursor_secret", "")
+    detail = "Snapshot pagination requires CURSOR_SECRET to be set"
+
+    assert_invalid(cursor, detail)
+    with pytest.raises(HTTPException) as exc_info:
+        PurchaseOrderService.list_orders_with_cursor(
+            db,
+            cursor=None,
+            limit=10,
+            snapshot=True,
+        )
+    assert exc_info.value.detail == detail
+
+
+def walk(db, *, limit, snapshot=False):
+    ids = []
+    cursor = None
+    while True:
+        page = PurchaseOrderService.list_orders_with_cursor(
+            db,
+            cursor=cursor,
+            limit=limit,
+            snapshot=snapshot and cursor is None,
+        )
+        ids.extend(item.id for item in page.items)
+        if not page.has_more:
+            return ids
+        cursor = page.next_cursor
+
+
+def first_page(db, *, limit):
+    return PurchaseOrderService.list_orders_with_cursor(
+        db,
+        cursor=None,
+        limit=limit,
+        snapshot=True,
+    )
+
+
+def next_ids(db, page, *, limit):
+    return [
+        item.id
+        for item in PurchaseOrderService.list_orders_with_cursor(
+            db,
+            cursor=page.next_cursor,
+            limit=limit,
+        ).items
+    ]
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 5, 10])
+@pytest.mark.parametrize("snapshot", [False, True])
+def test_cursor_walk_returns_every_row_once(db, orders, limit, snapshot):
+    assert walk(db, limit=limit, snapshot=snapshot) == [1, 2, 3, 4, 5]
+
+
+def test_next_cursor_points_at_the_last_returned_row(db, orders):
+    page = PurchaseOrderService.list_orders_with_cursor(db, cursor=None, limit=2)
+
+    assert [item.id for item in page.items] == [1, 2]
+    assert page.has_more
+    assert decode_cursor(page.next_cursor) == (2, None)
+
+
+def test_last_full_page_has_no_next_cursor(db, orders):
+    page = PurchaseOrderService.list_orders_with_cursor(
+        db,
+        cursor=encode_cursor(3),
+        limit=2,
+    )
+
+    assert [item.id for item in page.items] == [4, 5]
+    assert not page.has_more
+    assert page.next_cursor is None
+
+
+def test_delete_right_after_pinning_stays_visible_in_snapshot(db, orders):
+    page = first_page(db, limit=2)
+    # Same database clock second as the pin: timestamps cannot tell these apart.
+    PurchaseOrderService.delete_order(db, 4)
+
+    assert next_ids(db, page, limit=10) == [3, 4, 5]
+    assert walk(db, limit=10) == [1, 2, 3, 5]
+
+
+def test_delete_before_pinning_is_hidden_from_snapshot(db, orders):
+    PurchaseOrderService.delete_order(db, 4)
+    page = first_page(db, limit=2)
+
+    assert next_ids(db, page, limit=10) == [3, 5]
+
+
+def test_rows_created_after_pinning_are_excluded_from_snapshot(db, orders):
+    page = first_page(db, limit=2)
+    db.add(
+        PurchaseOrder(
+            item_name="Late",
+            order_date=date(2025, 1, 1),
+            delivery_date=date(2025, 1, 15),
+            quantity=1,
+            unit_price_cents=100,
+        )
+    )
+    db.commit()
+
+    assert next_ids(db, page, limit=10) == [3, 4, 5]
+    assert walk(db, limit=10) == [1, 2, 3, 4, 5, 6]
+
+
+def test_batch_soft_delete_is_stamped_after_the_pin(db, orders):
+    snapshot = PurchaseOrderRepository.get_snapshot(db)
+    assert PurchaseOrderRepository.soft_delete_batch(db, batch_size=2) == 2
+
+    visible = PurchaseOrderRepository.list_orders(
+        db,
+        last_id=None,
+        limit=10,
+        snapshot=snapshot,
+    )
+    assert [order.id for order in visible] == [1, 2, 3, 4, 5]
+    assert walk(db, limit=10) == [3, 4, 5]